@@ -29,6 +29,8 @@ REQUIRED = [
 # What packages are optional?
 EXTRAS = {
     # 'fancy feature': ['django'],
+    "fast-json": ["orjson"],
+    "streaming-json": ["ijson"],
 }
 
 # The rest you shouldn't have to touch too much :)
@@ -0,0 +1,151 @@
+from zipfile import ZipFile
+
+import pandas as pd
+import pytest
+
+from usaspending_client import USASpending
+from usaspending_client.aggregate import aggregate_archive
+from usaspending_client.aggregate import merge_aggregates
+
+
+CONTRACTS = """contract_award_unique_key,awarding_agency_name,recipient_name,federal_action_obligation
+C1,Department of Energy,ACME,100.0
+C2,Department of Energy,INITECH,300.0
+C3,Department of Agriculture,ACME,50.0
+"""
+
+ASSISTANCE = """assistance_award_unique_key,awarding_agency_name,recipient_name,federal_action_obligation
+A1,Department of Energy,ACME,200.0
+A2,Department of Agriculture,GLOBEX,75.0
+"""
+
+
+@pytest.fixture()
+def archive(tmp_path):
+    path = tmp_path / "awards.zip"
+    with ZipFile(path, "w") as zf:
+        zf.writestr("Contracts_1.csv", CONTRACTS)
+        zf.writestr("Assistance_1.csv", ASSISTANCE)
+    yield str(path)
+
+
+class TestAggregateArchive(object):
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_sums_and_counts_across_members(self, archive, workers):
+        df = aggregate_archive(
+            archive,
+            by=["awarding_agency_name"],
+            values=["federal_action_obligation"],
+            chunksize=1,
+            workers=workers,
+        )
+        energy = df.loc["Department of Energy"]
+        assert energy["federal_action_obligation_sum"] == 600.0
+        assert energy["count"] == 3
+
+    def test_predicate(self, archive):
+        df = aggregate_archive(
+            archive,
+            by=["recipient_name"],
+            predicate="federal_action_obligation > 60",
+        )
+        assert df.loc["ACME", "count"] == 2
+        assert list(df.columns) == ["count"]
+
+    def test_header_only_member_keeps_numeric_dtypes(self, tmp_path):
+        path = tmp_path / "awards.zip"
+        with ZipFile(path, "w") as zf:
+            zf.writestr("Contracts_1.csv", CONTRACTS)
+            zf.writestr("Contracts_2.csv", CONTRACTS.splitlines()[0] + "\n")
+        df = aggregate_archive(
+            str(path),
+            by=["awarding_agency_name"],
+            values=["federal_action_obligation"],
+        )
+        assert df["federal_action_obligation_sum"].dtype == "float64"
+        assert df["count"].dtype == "int64"
+        assert df.loc["Department of Energy", "count"] == 2
+
+    def test_key_type_differs_between_chunks(self, tmp_path):
+        path = tmp_path / "awards.zip"
+        with ZipFile(path, "w") as zf:
+            zf.writestr("Contracts_1.csv", "psc,v\n7030,1\n7030,2\nR425,3\n7030,4\n")
+        df = aggregate_archive(str(path), by=["psc"], values=["v"], chunksize=2)
+        assert list(df.index) == ["7030", "R425"]
+        assert df.loc["7030", "v_sum"] == 7
+        assert df.loc["7030", "count"] == 3
+
+
+class TestMergeAggregates(object):
+    def test_top_n_single_key(self):
+        partial = pd.DataFrame(
+            {"v_sum": [1.0, 3.0, 2.0], "count": [5, 1, 1]},
+            index=pd.Index(["a", "b", "c"], name="k"),
+        )
+        assert list(merge_aggregates([partial], ["k"], top_n=2).index) == ["b", "c"]
+        top = merge_aggregates([partial], ["k"], top_n=1, sort_by="count")
+        assert list(top.index) == ["a"]
+
+    def test_top_n_per_outer_key(self):
+        first = pd.DataFrame(
+            {"v_sum": [1.0, 5.0, 2.0], "count": [1, 1, 1]},
+            index=pd.MultiIndex.from_tuples(
+                [("x", "p"), ("x", "q"), ("y", "p")], names=["a", "r"]
+            ),
+        )
+        second = pd.DataFrame(
+            {"v_sum": [3.0, 9.0], "count": [1, 1]},
+            index=pd.MultiIndex.from_tuples([("x", "p"), ("y", "s")], names=["a", "r"]),
+        )
+        top = merge_aggregates([first, second], ["a", "r"], top_n=1)
+        assert list(top.index) == [("x", "q"), ("y", "s")]
+        assert top.loc[("y", "s"), "v_sum"] == 9.0
+
+
+SHARDS = {
+    "2019-10-01": {"Contracts_1.csv": CONTRACTS},
+    "2020-10-01": {"Assistance_1.csv": ASSISTANCE},
+}
+
+
+class TestBulkAggregate(object):
+    def test_bulk_aggregate(self, static_transport):
+        transport = static_transport({"awards": {"Contracts_1.csv": CONTRACTS}})
+        usa = USASpending(transport=transport)
+        df = usa.bulk_aggregate(
+            by=["awarding_agency_name", "recipient_name"],
+            values=["federal_action_obligation"],
+            top_n=1,
+            filters={"prime_award_types": ["A"]},
+        )
+        assert list(df.index) == [
+            ("Department of Agriculture", "ACME"),
+            ("Department of Energy", "INITECH"),
+        ]
+
+    @pytest.mark.parametrize("use_filters", [True, False])
+    def test_date_shards(self, static_transport, use_filters):
+        transport = static_transport(SHARDS)
+        usa = USASpending(transport=transport)
+        if use_filters:
+            kwargs = {"filters": {"prime_award_types": ["A"]}}
+        else:
+            kwargs = {"prime_award_types": ["A"]}
+        df = usa.bulk_aggregate(
+            by=["awarding_agency_name"],
+            values=["federal_action_obligation"],
+            date_shards=[("2019-10-01", "2020-09-30"), ("2020-10-01", "2021-09-30")],
+            workers=2,
+            **kwargs,
+        )
+        assert df.loc["Department of Energy", "federal_action_obligation_sum"] == 600.0
+        assert df.loc["Department of Agriculture", "count"] == 2
+
+        posted = [
+            kw["json"]["filters"]
+            for method, url, kw in transport.requests
+            if method == "POST"
+        ]
+        date_ranges = sorted(f["date_range"]["start_date"] for f in posted)
+        assert date_ranges == ["2019-10-01", "2020-10-01"]
+        assert all(f["prime_award_types"] == ["A"] for f in posted)
@@ -2,6 +2,8 @@ import json
 import logging
 import pytest
 
+from zipfile import BadZipFile
+
 from usaspending_client import USASpending
 
 
@@ -109,6 +111,12 @@ class TestClient(object):
         df = usa.bulk_awards(filters=filters)
         assert not df.empty
 
+    def test_bulk_awards_dataframe_error_is_raised(self, usa, monkeypatch):
+        monkeypatch.setattr(usa, "_bulk_file_url_", lambda **kwargs: "file_url")
+        monkeypatch.setattr(usa, "_download_", lambda url, f: f.write(b"not a zip"))
+        with pytest.raises(BadZipFile):
+            usa.bulk_awards(filters=data_tests[0])
+
     def test_awards_200_response(self, usa):
         response = usa.awards(award_id="CONT_AWD_12639519P0311_12K3_-NONE-_-NONE-")
         assert response.status_code == 200
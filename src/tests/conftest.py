@@ -0,0 +1,63 @@
+import io
+import json
+from zipfile import ZipFile
+
+import pytest
+import requests
+
+from usaspending_client.transport import Transport
+
+
+BASE_URL = "https://api.usaspending.gov"
+FILE_URL = "https://files.usaspending.gov/generated_downloads/"
+
+
+def make_response(data, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response.encoding = "utf-8"
+    response._content = json.dumps(data).encode("utf-8")
+    return response
+
+
+class StaticTransport(Transport):
+    """Serves canned USASpending responses without the network.
+
+    `archives` maps a bulk download file name to its csv members.  The file
+    name of a bulk download is the start date of its filters, `'awards'`
+    without one.  `awards` maps award ids to awards endpoint documents.
+    """
+
+    def __init__(self, archives, awards=None):
+        self.archives = {}
+        for file_name, members in archives.items():
+            buffer = io.BytesIO()
+            with ZipFile(buffer, "w") as zf:
+                for member, csv in members.items():
+                    zf.writestr(member, csv)
+            self.archives[file_name] = buffer.getvalue()
+        self.awards = awards or {}
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs))
+        if url == BASE_URL + "/api/v2/bulk_download/awards/":
+            date_range = kwargs["json"]["filters"].get("date_range", {})
+            return make_response({"file_name": date_range.get("start_date", "awards")})
+        if url.startswith(BASE_URL + "/api/v2/download/status/"):
+            file_name = url.split("file_name=")[1]
+            data = {"status": "finished", "file_url": FILE_URL + file_name}
+            return make_response(data)
+        if url.startswith(BASE_URL + "/api/v2/awards/"):
+            award_id = url.rsplit("/", 1)[1]
+            if award_id in self.awards:
+                return make_response(self.awards[award_id])
+        return make_response({"detail": "Not found"}, status_code=404)
+
+    def download(self, url, f):
+        f.write(self.archives[url[len(FILE_URL) :]])
+
+
+@pytest.fixture()
+def static_transport():
+    yield StaticTransport
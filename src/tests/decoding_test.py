@@ -0,0 +1,36 @@
+from io import BytesIO
+
+import pytest
+import requests
+
+from usaspending_client import USASpending
+from usaspending_client import decoding
+
+
+DOCUMENT = b'{"id": 1, "children": [{"award_id": "A1"}, {"award_id": "A2"}]}'
+
+
+class TestDecoding(object):
+    def test_loads_bytes(self):
+        assert decoding.loads(DOCUMENT)["id"] == 1
+
+    @pytest.mark.parametrize("streaming", [True, False])
+    def test_iter_items(self, monkeypatch, streaming):
+        if not streaming:
+            monkeypatch.setattr(decoding, "ijson", None)
+        elif decoding.ijson is None:
+            pytest.skip("ijson not installed")
+        items = list(decoding.iter_items(BytesIO(DOCUMENT), "children.item"))
+        assert [item["award_id"] for item in items] == ["A1", "A2"]
+
+
+class TestAwardsPrefix(object):
+    def test_streams_items(self, static_transport):
+        award = {"generated_unique_award_id": "C1", "children": [{"a": 1}, {"a": 2}]}
+        usa = USASpending(transport=static_transport({}, awards={"C1": award}))
+        assert list(usa.awards("C1", prefix="children.item")) == [{"a": 1}, {"a": 2}]
+
+    def test_missing_award_raises(self, static_transport):
+        usa = USASpending(transport=static_transport({}))
+        with pytest.raises(requests.HTTPError):
+            usa.awards("X", prefix="children.item")
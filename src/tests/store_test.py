@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from usaspending_client import AwardStore, USASpending
+
+
+@pytest.fixture()
+def store():
+    store = AwardStore()
+    yield store
+    store.close()
+
+
+bulk_df = pd.DataFrame(
+    {
+        "contract_award_unique_key": ["CONT_AWD_1", "CONT_AWD_2"],
+        "recipient_name": ["ACME", "INITECH"],
+        "awarding_agency_name": ["Department of Energy", "Department of Energy"],
+        "total_dollars_obligated": [100.0, 200.0],
+    }
+)
+
+api_award = {
+    "generated_unique_award_id": "CONT_AWD_1",
+    "recipient": {"recipient_name": "ACME"},
+    "awarding_agency": {"toptier_agency": {"name": "Department of Energy"}},
+    "total_obligation": 100.0,
+}
+
+
+class TestAwardStore(object):
+    def test_add_df(self, store):
+        store.add_df(bulk_df)
+        assert len(store) == 2
+        assert store.get("CONT_AWD_2") is None
+        assert store.get("CONT_AWD_2", bulk=True)["total_dollars_obligated"] == 200.0
+        assert store.get("CONT_AWD_3", bulk=True) is None
+
+    def test_api_record_replaces_bulk_row(self, store):
+        store.add_df(bulk_df)
+        store.add_awards([api_award])
+        store.add_df(bulk_df)
+        assert store.get("CONT_AWD_1") == api_award
+
+    def test_indexed_lookups(self, store):
+        store.add_df(bulk_df)
+        assert len(store.by_recipient("INITECH")) == 1
+        assert len(store.by_agency("Department of Energy")) == 2
+        found = store.get_many(["CONT_AWD_1", "CONT_AWD_3"], bulk=True, batch_size=1)
+        assert list(found) == ["CONT_AWD_1"]
+
+    def test_missing_values_stored_as_null(self, store):
+        df = bulk_df.assign(total_dollars_obligated=[np.nan, 200.0])
+        store.add_df(df)
+        (data,) = store.connection.execute(
+            "SELECT data FROM awards WHERE generated_unique_award_id = 'CONT_AWD_1'"
+        ).fetchone()
+        assert "NaN" not in data
+        assert store.get("CONT_AWD_1", bulk=True)["total_dollars_obligated"] is None
+
+    def test_fuller_bulk_row_replaces_projected_row(self, store):
+        store.add_df(bulk_df[["contract_award_unique_key", "recipient_name"]])
+        store.add_df(bulk_df)
+        assert store.get("CONT_AWD_1", bulk=True)["total_dollars_obligated"] == 100.0
+        store.add_df(bulk_df[["contract_award_unique_key", "recipient_name"]])
+        assert store.get("CONT_AWD_1", bulk=True)["total_dollars_obligated"] == 100.0
+
+
+    def test_latest_transaction_kept(self, store):
+        df = pd.DataFrame(
+            {
+                "contract_award_unique_key": ["CONT_AWD_1", "CONT_AWD_1", "CONT_AWD_1"],
+                "action_date": ["2020-03-01", "2020-01-15", "2020-02-01"],
+                "federal_action_obligation": [300.0, 100.0, 200.0],
+            }
+        )
+        store.add_df(df)
+        assert len(store) == 1
+        assert store.get("CONT_AWD_1", bulk=True)["action_date"] == "2020-03-01"
+        store.add_df(df.iloc[[1]])
+        assert store.get("CONT_AWD_1", bulk=True)["federal_action_obligation"] == 300.0
+
+
+CSV = """contract_award_unique_key,recipient_name,total_dollars_obligated
+C1,ACME,100.0
+C2,INITECH,2000000.0
+"""
+
+
+class TestClientStore(object):
+    def test_projected_bulk_rows_not_served_as_awards(self, store, static_transport):
+        award = dict(api_award, generated_unique_award_id="C1")
+        transport = static_transport(
+            {"awards": {"Contracts_1.csv": CSV}}, awards={"C1": award}
+        )
+        usa = USASpending(store=store, transport=transport)
+        columns = ["contract_award_unique_key", "recipient_name"]
+        usa.bulk_awards(filters={"prime_award_types": ["A"]}, columns=columns)
+
+        assert usa.awards("C1", return_json=True) == award
+        assert usa.awards("C2", return_json=True, bulk_records=True) == {
+            "contract_award_unique_key": "C2",
+            "recipient_name": "INITECH",
+        }
+        assert usa.awards_list(["C1", "C2"], return_json=True)[0] == award
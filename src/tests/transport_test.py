@@ -0,0 +1,56 @@
+import io
+
+import pytest
+
+from usaspending_client import USASpending, RecordingTransport, ReplayTransport
+from usaspending_client import Transport
+
+
+FILTERS = {"prime_award_types": ["A"]}
+
+CSV = """contract_award_unique_key,recipient_name,total_dollars_obligated
+C1,ACME,100.0
+C2,INITECH,2000000.0
+"""
+
+
+class TestRecordReplay(object):
+    def test_bulk_awards_replay(self, tmp_path, static_transport):
+        transport = static_transport({"awards": {"Contracts_1.csv": CSV}})
+        recorder = RecordingTransport(str(tmp_path), transport=transport)
+        recorded = USASpending(transport=recorder).bulk_awards(filters=FILTERS)
+
+        usa = USASpending(transport=ReplayTransport(str(tmp_path)))
+        replayed = usa.bulk_awards(filters=FILTERS)
+        assert replayed.equals(recorded)
+        assert list(replayed.contract_award_unique_key) == ["C1", "C2"]
+
+    def test_replay_missing_request(self, tmp_path):
+        usa = USASpending(transport=ReplayTransport(str(tmp_path)))
+        with pytest.raises(KeyError):
+            usa.awards(award_id="CONT_AWD_1")
+
+    def test_request_and_download_recorded_separately(self, tmp_path, static_transport):
+        url = "https://files.usaspending.gov/generated_downloads/awards"
+        transport = static_transport({"awards": {"Contracts_1.csv": CSV}})
+        recorder = RecordingTransport(str(tmp_path), transport=transport)
+        recorder.request("GET", url)
+        recorder.download(url, io.BytesIO())
+        recorder.request("POST", url, data="a")
+        recorder.request("POST", url, data="b")
+        assert len(list(tmp_path.glob("*.json"))) == 4
+
+        replay = ReplayTransport(str(tmp_path))
+        assert replay.request("GET", url).status_code == 404
+        f = io.BytesIO()
+        replay.download(url, f)
+        assert f.getvalue() == transport.archives["awards"]
+
+
+    def test_incomplete_transport_fails_on_creation(self):
+        class RequestOnly(Transport):
+            def request(self, method, url, **kwargs):
+                pass
+
+        with pytest.raises(TypeError):
+            RequestOnly()
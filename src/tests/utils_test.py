@@ -0,0 +1,67 @@
+from io import StringIO
+
+import pandas as pd
+import pytest
+
+from usaspending_client.utils import iter_csv_chunks
+
+
+CSV = """award_id,recipient_name,total_dollars_obligated,awarding_agency_name
+A1,ACME,100.0,Department of Energy
+A2,ACME,2500000.0,Department of Energy
+A3,INITECH,3000000.0,Department of Energy
+A4,INITECH,50.0,Department of Energy
+"""
+
+
+class TestIterCsvChunks(object):
+    def test_columns_are_projected(self):
+        columns = ["award_id", "total_dollars_obligated"]
+        chunks = iter_csv_chunks(StringIO(CSV), columns=columns, chunksize=2)
+        df = pd.concat(chunks, ignore_index=True)
+        assert list(df.columns) == columns
+        assert len(df) == 4
+
+    def test_query_predicate(self):
+        chunks = iter_csv_chunks(
+            StringIO(CSV), predicate="total_dollars_obligated > 1e6", chunksize=1
+        )
+        df = pd.concat(chunks, ignore_index=True)
+        assert list(df.award_id) == ["A2", "A3"]
+
+    def test_callable_predicate(self):
+        chunks = iter_csv_chunks(
+            StringIO(CSV),
+            columns=["award_id", "recipient_name"],
+            predicate=lambda df: df.recipient_name == "INITECH",
+            chunksize=3,
+        )
+        df = pd.concat(chunks, ignore_index=True)
+        assert list(df.award_id) == ["A3", "A4"]
+
+    def test_query_predicate_on_unkept_column(self):
+        chunks = iter_csv_chunks(
+            StringIO(CSV),
+            columns=["award_id"],
+            predicate="total_dollars_obligated > 1e6",
+            chunksize=2,
+        )
+        df = pd.concat(chunks, ignore_index=True)
+        assert list(df.columns) == ["award_id"]
+        assert list(df.award_id) == ["A2", "A3"]
+
+    def test_callable_predicate_on_unkept_column(self):
+        chunks = iter_csv_chunks(
+            StringIO(CSV),
+            columns=["award_id"],
+            predicate=lambda df: df.total_dollars_obligated > 1e6,
+        )
+        with pytest.raises(ValueError):
+            list(chunks)
+
+    def test_dtype_keeps_mixed_codes_consistent(self):
+        csv = "psc,v\n7030,1\n7030,2\nR425,3\n7030,4\n"
+        chunks = iter_csv_chunks(StringIO(csv), chunksize=2, dtype={"psc": str})
+        df = pd.concat(chunks, ignore_index=True)
+        assert list(df.psc) == ["7030", "7030", "R425", "7030"]
+        assert (df.psc == "7030").sum() == 3
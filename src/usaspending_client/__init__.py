@@ -1 +1,3 @@
 from .client import USASpending
+from .store import AwardStore
+from .transport import Transport, RequestsTransport, RecordingTransport, ReplayTransport
@@ -0,0 +1,194 @@
+import logging
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from zipfile import ZipFile
+
+import numpy as np
+import pandas as pd
+
+from .utils import iter_csv_chunks
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+def aggregate_chunks(chunks, by, values=None, assign=None):
+    """Group-by sums and counts computed incrementally over dataframe chunks.
+
+    Each chunk is reduced to one row per group before the next chunk is
+    read, so memory scales with the number of groups, not rows.
+
+    Parameters
+    ----------
+    chunks : iterable[pd.DataFrame]
+        Dataframe chunks, e.g. from `iter_csv_chunks`.
+    by : list[str]
+        Group keys.
+    values : list[str]
+        Columns to sum, written to `<column>_sum`.
+    assign : dict
+        Columns derived on each chunk with `pd.DataFrame.assign` before
+        grouping, e.g. a fiscal month key.
+
+    Returns
+    -------
+    pd.DataFrame
+        Partial aggregate indexed by `by` with sum columns and a `count` column.
+    """
+    values = values or []
+    partials = []
+    for chunk in chunks:
+        # Header only csv's parse to one empty chunk of object columns.
+        if chunk.empty:
+            continue
+        if assign:
+            chunk = chunk.assign(**assign)
+        grouped = chunk.groupby(by, dropna=False)
+        partial = grouped.size().to_frame("count")
+        if values:
+            sums = grouped[values].sum().add_suffix("_sum")
+            partial = sums.join(partial)
+        # Fold as we go so at most two partials are held at once.
+        partials = [merge_aggregates(partials + [partial], by)]
+    if not partials:
+        data = {f"{v}_sum": np.array([], dtype="float64") for v in values}
+        data["count"] = np.array([], dtype="int64")
+        if len(by) > 1:
+            index = pd.MultiIndex.from_arrays([[]] * len(by), names=by)
+        else:
+            index = pd.Index([], name=by[0])
+        return pd.DataFrame(data, index=index)
+    return partials[0]
+
+
+def merge_aggregates(partials, by, top_n=None, sort_by=None):
+    """Merges partial aggregates, e.g. from archive members or date shards.
+
+    Parameters
+    ----------
+    partials : list[pd.DataFrame]
+        Outputs of `aggregate_chunks` or `merge_aggregates`.
+    by : list[str]
+        Group keys the partials are indexed by.
+    top_n : int
+        Keep only the `top_n` largest groups.  With several keys the largest
+        last-key groups are kept per combination of the other keys.
+    sort_by : str
+        Column ranking groups for `top_n`, the first sum column by default.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    if len(partials) == 1:
+        result = partials[0]
+    else:
+        levels = list(range(len(by)))
+        result = pd.concat(partials).groupby(level=levels, dropna=False).sum()
+
+    if top_n:
+        sort_by = sort_by or result.columns[0]
+        result = result.sort_values(sort_by, ascending=False)
+        if len(by) > 1:
+            levels = list(range(len(by) - 1))
+            result = result.groupby(level=levels, dropna=False).head(top_n)
+            result = result.sort_index(level=levels, sort_remaining=False)
+        else:
+            result = result.head(top_n)
+    return result
+
+
+def _aggregate_member_(
+    member, path, by, values, columns, predicate, assign, chunksize, dtype
+):
+    LOGGER.debug(f"Aggregating {member}")
+    with ZipFile(path) as zf, zf.open(member) as f:
+        chunks = iter_csv_chunks(
+            f,
+            columns=columns,
+            predicate=predicate,
+            chunksize=chunksize,
+            dtype=dtype,
+        )
+        return aggregate_chunks(chunks, by, values=values, assign=assign)
+
+
+def aggregate_archive(
+    path,
+    by,
+    values=None,
+    columns=None,
+    predicate=None,
+    assign=None,
+    chunksize=100000,
+    dtype=None,
+    workers=1,
+):
+    """Aggregates every csv member of a bulk award zip archive.
+
+    Members are aggregated independently, in separate processes when
+    `workers` > 1, and their partial results are merged.  Parsing and grouping
+    are CPU bound, so threads would mostly wait on each other.
+
+    Parameters
+    ----------
+    path : str
+        Zip archive location.
+    by : list[str]
+        Group keys.
+    values : list[str]
+        Columns to sum.
+    columns : list[str]
+        Columns to parse.  Defaults to `by` + `values`, plus any column a query
+        string `predicate` uses.  All columns are parsed when `predicate` is a
+        callable or `assign` is given.
+    predicate : str or callable
+        Row filter, see `iter_csv_chunks`.
+    assign : dict
+        Derived columns, see `aggregate_chunks`.
+    chunksize : int
+        Number of csv rows parsed at a time.
+    dtype : dict
+        Column types passed to `pd.read_csv`.  `by` columns are always parsed
+        as `str`, as types are inferred per chunk and a code key such as
+        `'7030'` would otherwise split into int and str groups.
+    workers : int
+        Number of archive members aggregated concurrently.  Above 1 a
+        callable `predicate` and the `assign` callables must be picklable,
+        e.g. module level functions rather than lambdas.
+
+    Returns
+    -------
+    pd.DataFrame
+        Aggregate indexed by `by` with sum columns and a `count` column.
+    """
+    values = values or []
+    if columns is None and not callable(predicate) and not assign:
+        columns = list(by) + list(values)
+    # Keys derived with `assign` are not csv columns and keep their own type.
+    dtype = {**{c: str for c in by if c not in (assign or {})}, **(dtype or {})}
+
+    with ZipFile(path) as zf:
+        members = [s for s in zf.namelist() if ".csv" in s]
+
+    aggregate_member = partial(
+        _aggregate_member_,
+        path=path,
+        by=by,
+        values=values,
+        columns=columns,
+        predicate=predicate,
+        assign=assign,
+        chunksize=chunksize,
+        dtype=dtype,
+    )
+    if workers > 1 and len(members) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partials = list(executor.map(aggregate_member, members))
+    else:
+        partials = [aggregate_member(member) for member in members]
+
+    if not partials:
+        raise ValueError(f"No csv files found in {path}")
+    return merge_aggregates(partials, by)
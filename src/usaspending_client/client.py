@@ -1,17 +1,23 @@
 import logging
+import os
 import sys
-import json
 
-from io import BytesIO
-from urllib.request import urlretrieve
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import TemporaryDirectory
+from tempfile import TemporaryFile
 from urllib.request import urlopen
 import shutil
-import requests
 import pandas as pd
 from zipfile import ZipFile
 
+from .aggregate import aggregate_archive
+from .aggregate import merge_aggregates
+from .decoding import iter_response
+from .decoding import loads
+from .transport import RequestsTransport
 from .utils import log_decorator
 from .utils import flatten_dict
+from .utils import iter_csv_chunks
 
 
 LOGGER = logging.getLogger(__name__)
@@ -20,8 +26,25 @@ FORMAT = "%(levelname)s - %(asctime)s - %(name)s - %(message)s"
 
 
 class USASpending:
-    def __init__(self, verbosity=10):
+    """Client for the USASpending API.
+
+    Parameters
+    ----------
+    verbosity : int
+        Logging level.
+    store : AwardStore
+        Optional local award store.  `bulk_awards` and `awards` populate it and
+        `awards`/`awards_list` resolve from it before calling the API when
+        returning json.
+    transport : Transport
+        Object sending every request, e.g. a `RecordingTransport` or
+        `ReplayTransport`.  A `RequestsTransport` by default.
+    """
+
+    def __init__(self, verbosity=10, store=None, transport=None):
         self.BASE_URL = "https://api.usaspending.gov"
+        self.store = store
+        self.transport = transport or RequestsTransport()
         logging.basicConfig(stream=sys.stderr, level=verbosity, format=FORMAT)
 
     @staticmethod
@@ -164,7 +187,7 @@ class USASpending:
                 if v and kwarg not in ["self", "start_date", "end_date", "url"]:
                     filters.update({kwarg: v})
 
-        response = requests.post(url=url, json={"filters": filters})
+        response = self.transport.post(url, json={"filters": filters})
         self._log_response_(response)
         return response
 
@@ -181,10 +204,36 @@ class USASpending:
             File name returned in a bulk_download response object
         """
         url = self.BASE_URL + f"/api/v2/download/status/?file_name={file_name}"
-        response = requests.get(url)
+        response = self.transport.get(url)
         self._log_response_(response)
         return response
 
+    def _bulk_file_url_(self, attempts=10, **kwargs):
+        """Requests a bulk download and returns its file url once finished."""
+        rqst = self.bulk_download_awards(**kwargs)
+
+        data = loads(rqst.content)
+        file_name = data["file_name"]
+        status = None
+        runs = 0
+        while status != "finished" and runs < attempts:
+            dl_status = self.bulk_download_status(file_name=file_name)
+            data = loads(dl_status.content)
+            status = data["status"]
+            runs += 1
+
+        try:
+            file_url = data["file_url"]
+            LOGGER.debug(file_url)
+        except KeyError:
+            raise KeyError(f"Bulk download did not finish in {attempts} attempts.")
+        return file_url
+
+    def _download_(self, file_url, f):
+        """Streams the file at `file_url` into the open binary file `f`."""
+        self.transport.download(file_url, f)
+        f.seek(0)
+
     @LD
     def bulk_awards(
         self,
@@ -202,6 +251,10 @@ class USASpending:
         return_df=True,
         file_destination=None,
         attempts=10,
+        columns=None,
+        predicate=None,
+        chunksize=100000,
+        dtype=None,
     ):
 
         """This method sends a request to the backend to begin generating a
@@ -279,6 +332,21 @@ class USASpending:
         attempts: int
             Number of times to check if bulk download has completed.
 
+        columns: list[str]
+            Only parse these csv columns, all columns if None.
+
+        predicate: str or callable
+            Row filter applied to each parsed chunk, either a `pd.DataFrame.query`
+            expression or a callable returning a boolean mask for the chunk.
+
+        chunksize: int
+            Number of csv rows parsed at a time when building the dataframe.
+
+        dtype: type or dict
+            Column types passed to `pd.read_csv`.  Types are inferred per chunk,
+            so code columns mixing digits and letters need an explicit type,
+            e.g. `{"product_or_service_code": str}`, to parse consistently.
+
         ## Agency: object
 
         - name: str
@@ -319,6 +387,9 @@ class USASpending:
         >>> #using filters object
         >>> filters = {"prime_award_types": ["A"],"sub_award_types": [],"date_type": "action_date","date_range": {"start_date": "2019-10-01","end_date": "2020-09-30"},"agencies": [{"type": "funding","tier": "subtier","name": "Animal and Plant Health Inspection Service","toptier_name": "Department of Agriculture"}]}
         >>> df = usa.awards(filters=filters)
+        >>> #keeping only some columns and rows
+        >>> columns = ["contract_award_unique_key", "recipient_name", "total_dollars_obligated"]
+        >>> df = usa.bulk_awards(filters=filters, columns=columns, predicate="total_dollars_obligated > 1e6")
         ```
         """
 
@@ -326,7 +397,8 @@ class USASpending:
             msg = "Need to return a pandas dataframe or provide file location for download"
             raise ValueError(msg)
 
-        rqst = self.bulk_download_awards(
+        file_url = self._bulk_file_url_(
+            attempts=attempts,
             start_date=start_date,
             end_date=end_date,
             date_type=date_type,
@@ -340,42 +412,164 @@ class USASpending:
             filters=filters,
         )
 
-        data = json.loads(rqst.text)
-        file_name = data["file_name"]
-        status = None
-        runs = 0
-        while status != "finished" and runs < attempts:
-            dl_status = self.bulk_download_status(file_name=file_name)
-            data = json.loads(dl_status.text)
-            status = data["status"]
-            runs += 1
-
-        try:
-            file_url = data["file_url"]
-            LOGGER.debug(file_url)
-        except KeyError:
-            raise KeyError(f"Bulk download did not finish in {attempts} attempts.")
-
         if return_df:
 
             try:
 
-                # ref: https://stackoverflow.com/a/39217788/4296857
                 # ref: https://stackoverflow.com/a/46676405/4296857
 
-                with requests.get(file_url, stream=True) as r:
-                    zf = ZipFile(BytesIO(r.content))
-                match = [s for s in zf.namelist() if ".csv" in s][0]
-                df = pd.read_csv(zf.open(match), low_memory=False)
+                with TemporaryFile() as f:
+                    self._download_(file_url, f)
+                    with ZipFile(f) as zf:
+                        match = [s for s in zf.namelist() if ".csv" in s][0]
+                        with zf.open(match) as member:
+                            chunks = []
+                            for chunk in iter_csv_chunks(
+                                member,
+                                columns=columns,
+                                predicate=predicate,
+                                chunksize=chunksize,
+                                dtype=dtype,
+                            ):
+                                if self.store is not None:
+                                    self.store.add_df(chunk)
+                                chunks.append(chunk)
+                            df = pd.concat(chunks, ignore_index=True)
                 return df
 
             except:
                 LOGGER.error("Failed to return dataframe", exc_info=True)
+                if not file_destination:
+                    raise
 
-        urlretrieve(file_url, file_destination)
+        with open(file_destination, "wb") as f:
+            self.transport.download(file_url, f)
 
     @LD
-    def awards(self, award_id, return_json=False):
+    def bulk_aggregate(
+        self,
+        by,
+        values=None,
+        top_n=None,
+        sort_by=None,
+        columns=None,
+        predicate=None,
+        assign=None,
+        chunksize=100000,
+        dtype=None,
+        workers=1,
+        date_shards=None,
+        attempts=10,
+        **kwargs,
+    ):
+        """Group-by sums, counts and top-N over bulk award csv's without
+            loading them into one dataframe.  Chunks are reduced to one row per
+            group as they are parsed, so memory scales with the number of groups.
+
+        Parameters
+        ----------
+        by : list[str]
+            Group keys, e.g. `["awarding_agency_name", "recipient_name"]`.
+        values : list[str]
+            Columns to sum, returned as `<column>_sum`.
+        top_n : int
+            Keep only the `top_n` largest groups, per combination of all but the
+            last key when grouping by several keys.
+        sort_by : str
+            Column ranking groups for `top_n`, the first sum column by default.
+        columns : list[str]
+            Columns to parse.  Defaults to `by` + `values`, plus any column a
+            query string `predicate` uses.  All columns are parsed when
+            `predicate` is a callable or `assign` is given.
+        predicate : str or callable
+            Row filter applied to each chunk, see `bulk_awards`.
+        assign : dict
+            Columns derived on each chunk with `pd.DataFrame.assign`, e.g. a
+            fiscal month group key.
+        chunksize : int
+            Number of csv rows parsed at a time.
+        dtype : dict
+            Column types passed to `pd.read_csv`.  `by` columns are always
+            parsed as `str`, so a code key mixing digits and letters groups
+            consistently across chunks.
+        workers : int
+            Number of archive members aggregated concurrently in separate
+            processes, or of date shards downloaded and aggregated concurrently
+            in threads when given.  Above 1 a callable `predicate` and the
+            `assign` callables must be picklable when aggregating members.
+        date_shards : list[tuple[str, str]]
+            Optional `(start_date, end_date)` pairs, each requested as its own
+            bulk download and merged into one result.
+        attempts : int
+            Number of times to check if each bulk download has completed.
+        **kwargs
+            Request arguments passed to `bulk_download_awards`.
+
+        Returns
+        -------
+        pd.DataFrame
+            Aggregate indexed by `by` with sum columns and a `count` column.
+
+        Examples
+        -------
+
+        ```python
+        >>> from usaspending_client import USASpending
+        >>> usa = USASpending()
+        >>> fiscal_month = lambda df: (pd.to_datetime(df.action_date).dt.month + 2) % 12 + 1
+        >>> df = usa.bulk_aggregate(
+        ...     by=["awarding_agency_name", "fiscal_month"],
+        ...     values=["federal_action_obligation"],
+        ...     assign={"fiscal_month": fiscal_month},
+        ...     columns=["awarding_agency_name", "action_date", "federal_action_obligation"],
+        ...     filters=filters,
+        ... )
+        ```
+        """
+        options = dict(
+            values=values,
+            columns=columns,
+            predicate=predicate,
+            assign=assign,
+            chunksize=chunksize,
+            dtype=dtype,
+        )
+
+        def aggregate_shard(shard_kwargs, member_workers):
+            file_url = self._bulk_file_url_(attempts=attempts, **shard_kwargs)
+            with TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "awards.zip")
+                with open(path, "wb") as f:
+                    self._download_(file_url, f)
+                return aggregate_archive(path, by, workers=member_workers, **options)
+
+        if not date_shards:
+            result = aggregate_shard(kwargs, workers)
+        else:
+            shards = []
+            for start_date, end_date in date_shards:
+                shard_kwargs = dict(kwargs)
+                if shard_kwargs.get("filters"):
+                    shard_filters = dict(shard_kwargs["filters"])
+                    shard_filters["date_range"] = {
+                        "start_date": start_date,
+                        "end_date": end_date,
+                    }
+                    shard_kwargs["filters"] = shard_filters
+                else:
+                    shard_kwargs.update(start_date=start_date, end_date=end_date)
+                shards.append(shard_kwargs)
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                partials = list(
+                    executor.map(aggregate_shard, shards, [1] * len(shards))
+                )
+            result = merge_aggregates(partials, by)
+
+        return merge_aggregates([result], by, top_n=top_n, sort_by=sort_by)
+
+    @LD
+    def awards(self, award_id, return_json=False, prefix=None, bulk_records=False):
         """Short summary.
 
         Parameters
@@ -384,11 +578,18 @@ class USASpending:
             Description of parameter `award_id`.
         return_json : type
             Description of parameter `return_json` (the default is False).
+        prefix : str
+            Stream the response and yield only the json objects at this ijson
+            style path, e.g. `'children.item'` (the default is None).
+        bulk_records : bool
+            Also resolve from bulk csv rows in the store.  These are flat
+            dictionaries keyed by csv column name holding only the parsed
+            columns, not awards endpoint documents (the default is False).
 
         Returns
         -------
         type
-            Description of returned object.
+            Description of returned object, a generator when `prefix` is given.
 
         Examples
         --------
@@ -398,14 +599,31 @@ class USASpending:
 
         """
         url = self.BASE_URL + f"/api/v2/awards/{award_id}"
-        response = requests.get(url)
+        if prefix is not None:
+            response = self.transport.get(url, stream=True)
+            self._log_response_(response)
+            if not response.ok:
+                response.close()
+                response.raise_for_status()
+            return iter_response(response, prefix)
+
+        if return_json and self.store is not None:
+            award = self.store.get(award_id, bulk=bulk_records)
+            if award is not None:
+                LOGGER.debug(f"Award {award_id} found in store")
+                return award
+
+        response = self.transport.get(url)
         self._log_response_(response)
         if return_json:
-            response = json.loads(response.text)
+            status = response.status_code
+            response = loads(response.content)
+            if self.store is not None and status == 200:
+                self.store.add_awards([response])
         return response
 
     @LD
-    def awards_list(self, award_ids, return_json=False):
+    def awards_list(self, award_ids, return_json=False, bulk_records=False):
         """Short summary.
 
         Parameters
@@ -414,6 +632,9 @@ class USASpending:
             Description of parameter `award_ids`.
         return_json : type
             Description of parameter `return_json` (the default is False).
+        bulk_records : bool
+            Also resolve from bulk csv rows in the store, see `awards`
+            (the default is False).
 
         Returns
         -------
@@ -427,9 +648,18 @@ class USASpending:
         >>>
 
         """
+        stored = {}
+        if return_json and self.store is not None:
+            stored = self.store.get_many(award_ids, bulk=bulk_records)
+            LOGGER.debug(f"{len(stored)} awards found in store")
+
         result = []
         for award_id in award_ids:
 
+            if award_id in stored:
+                result.append(stored[award_id])
+                continue
+
             try:
                 response = self.awards(award_id=award_id, return_json=return_json)
             except:
@@ -0,0 +1,82 @@
+import io
+import json
+import logging
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+def loads(content):
+    """Decodes json straight from response bytes.
+
+    Uses `orjson` when installed, otherwise the standard library decoder,
+    which also accepts bytes and so skips building an intermediate `str`.
+
+    Parameters
+    ----------
+    content : bytes or str
+        Json document, e.g. `response.content`.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _walk_(obj, keys):
+    if not keys:
+        yield obj
+        return
+    key, rest = keys[0], keys[1:]
+    if key == "item":
+        for value in obj:
+            yield from _walk_(value, rest)
+    elif key in obj:
+        yield from _walk_(obj[key], rest)
+
+
+def iter_items(fileobj, prefix):
+    """Yields the json objects found at `prefix` in a json file object.
+
+    With `ijson` installed the document is parsed incrementally, so only one
+    item is held in memory at a time.  Otherwise the whole document is
+    decoded with `loads` and walked.
+
+    Parameters
+    ----------
+    fileobj : file-like
+        Binary json file object, e.g. a streamed response body.
+    prefix : str
+        ijson style path, e.g. `'results.item'` for every element of the
+        `results` array.
+    """
+    if ijson is not None:
+        yield from ijson.items(fileobj, prefix, use_float=True)
+        return
+    LOGGER.debug("ijson not installed, decoding whole document")
+    keys = prefix.split(".") if prefix else []
+    yield from _walk_(loads(fileobj.read()), keys)
+
+
+def iter_response(response, prefix):
+    """Yields the json objects found at `prefix` in a response body.
+
+    The response is streamed when it was requested with `stream=True` and
+    closed once exhausted.
+    """
+    with response:
+        if response.raw is None or getattr(response, "_content_consumed", False):
+            fileobj = io.BytesIO(response.content)
+        else:
+            response.raw.decode_content = True
+            fileobj = response.raw
+        yield from iter_items(fileobj, prefix)
@@ -0,0 +1,217 @@
+import json
+import logging
+import sqlite3
+
+from .decoding import loads
+
+
+LOGGER = logging.getLogger(__name__)
+
+# Bulk award csv's name the award key differently for contracts and assistance.
+BULK_ID_COLUMNS = [
+    "generated_unique_award_id",
+    "contract_award_unique_key",
+    "assistance_award_unique_key",
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS awards (
+    generated_unique_award_id TEXT PRIMARY KEY,
+    recipient_name TEXT,
+    awarding_agency_name TEXT,
+    source TEXT NOT NULL,
+    column_count INTEGER NOT NULL,
+    action_date TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS awards_recipient_name ON awards (recipient_name);
+CREATE INDEX IF NOT EXISTS awards_awarding_agency_name ON awards (awarding_agency_name);
+"""
+
+
+class AwardStore:
+    """Local SQLite store of award records keyed by `generated_unique_award_id`.
+
+    Records come either from `USASpending.awards` responses (source `'api'`)
+    or from `USASpending.bulk_awards` csv rows (source `'bulk'`).  Bulk rows
+    are flat dictionaries keyed by csv column name holding only the columns
+    that were parsed.  Bulk award csv's have one row per transaction, so a
+    bulk record is a single transaction of the award, with transaction level
+    fields such as `federal_action_obligation`.
+
+    An api record always replaces a bulk row for the same award and a bulk row
+    never replaces an api record.  Between bulk rows, one with more columns
+    replaces one with fewer, and with the same number of columns the
+    transaction with the latest `action_date` is kept.
+
+    Parameters
+    ----------
+    path : str
+        Database file, an in memory database by default.
+
+    Examples
+    --------
+
+    ```python
+    >>> from usaspending_client import USASpending, AwardStore
+    >>> usa = USASpending(store=AwardStore("awards.db"))
+    >>> df = usa.bulk_awards(filters=filters)
+    >>> award = usa.awards(award_id="CONT_AWD_12639519P0311_12K3_-NONE-_-NONE-", return_json=True)
+    ```
+    """
+
+    def __init__(self, path=":memory:"):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM awards").fetchone()[0]
+
+    def __contains__(self, award_id):
+        return self.get(award_id, bulk=True) is not None
+
+    def close(self):
+        self.connection.close()
+
+    @staticmethod
+    def _api_row_(award):
+        recipient = award.get("recipient") or {}
+        agency = (award.get("awarding_agency") or {}).get("toptier_agency") or {}
+        return (
+            award["generated_unique_award_id"],
+            recipient.get("recipient_name"),
+            agency.get("name"),
+            "api",
+            len(award),
+            None,
+            json.dumps(award),
+        )
+
+    def add_awards(self, awards):
+        """Stores `awards` endpoint responses.
+
+        Parameters
+        ----------
+        awards : list[dict]
+            Decoded responses from the /api/v2/awards/ endpoint.
+        """
+        rows = (self._api_row_(award) for award in awards)
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO awards VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def add_df(self, df):
+        """Stores bulk award csv rows.
+
+        Rows are skipped if `df` has no award key column.  See `AwardStore`
+        for which row is kept when an award is already stored.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Rows of a bulk award csv, e.g. `USASpending.bulk_awards` output.
+        """
+        id_columns = [c for c in BULK_ID_COLUMNS if c in df.columns]
+        if not id_columns:
+            LOGGER.debug("No award key column, skipping store")
+            return
+
+        # json has no NaN, missing csv values are stored as null.
+        records = df.astype(object).where(df.notna(), None)
+        column_count = len(df.columns)
+
+        def rows():
+            for record in records.to_dict(orient="records"):
+                award_id = next(
+                    (record[c] for c in id_columns if isinstance(record[c], str)),
+                    None,
+                )
+                if award_id is None:
+                    continue
+                action_date = record.get("action_date")
+                yield (
+                    award_id,
+                    record.get("recipient_name"),
+                    record.get("awarding_agency_name"),
+                    "bulk",
+                    column_count,
+                    None if action_date is None else str(action_date),
+                    json.dumps(record, default=str, allow_nan=False),
+                )
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO awards VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (generated_unique_award_id) DO UPDATE SET "
+                "recipient_name = excluded.recipient_name, "
+                "awarding_agency_name = excluded.awarding_agency_name, "
+                "column_count = excluded.column_count, "
+                "action_date = excluded.action_date, "
+                "data = excluded.data "
+                "WHERE awards.source = 'bulk' AND ("
+                "excluded.column_count > awards.column_count "
+                "OR (excluded.column_count = awards.column_count "
+                "AND COALESCE(excluded.action_date, '') "
+                ">= COALESCE(awards.action_date, '')))",
+                rows(),
+            )
+
+    @staticmethod
+    def _sources_(bulk):
+        return ("api", "bulk") if bulk else ("api", "api")
+
+    def get(self, award_id, bulk=False):
+        """Returns the stored record for `award_id` or None.
+
+        Only api records are returned unless `bulk` is True, bulk records are
+        csv row dictionaries, not awards endpoint documents.
+        """
+        row = self.connection.execute(
+            "SELECT data FROM awards WHERE generated_unique_award_id = ? "
+            "AND source IN (?, ?)",
+            (award_id, *self._sources_(bulk)),
+        ).fetchone()
+        if row is None:
+            return None
+        return loads(row[0])
+
+    def get_many(self, award_ids, bulk=False, batch_size=500):
+        """Returns a dictionary of award id to record for stored `award_ids`.
+
+        See `get` for `bulk`.
+        """
+        award_ids = list(award_ids)
+        result = {}
+        for i in range(0, len(award_ids), batch_size):
+            batch = award_ids[i : i + batch_size]
+            placeholders = ", ".join("?" * len(batch))
+            rows = self.connection.execute(
+                "SELECT generated_unique_award_id, data FROM awards "
+                f"WHERE generated_unique_award_id IN ({placeholders}) "
+                "AND source IN (?, ?)",
+                [*batch, *self._sources_(bulk)],
+            )
+            result.update({award_id: loads(data) for award_id, data in rows})
+        return result
+
+    def _select_(self, column, value):
+        rows = self.connection.execute(
+            f"SELECT data FROM awards WHERE {column} = ?", (value,)
+        )
+        return [loads(data) for (data,) in rows]
+
+    def by_recipient(self, recipient_name):
+        """Returns all stored records for `recipient_name`, api and bulk."""
+        return self._select_("recipient_name", recipient_name)
+
+    def by_agency(self, awarding_agency_name):
+        """Returns all stored records for `awarding_agency_name`, api and bulk."""
+        return self._select_("awarding_agency_name", awarding_agency_name)
@@ -0,0 +1,188 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+
+from abc import ABC
+from abc import abstractmethod
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+LOGGER = logging.getLogger(__name__)
+DOWNLOAD_BLOCK_BYTES = 1024 * 1024
+
+
+class Transport(ABC):
+    """Base class of the objects sending `USASpending` requests.
+
+    Every `USASpending` call goes through a transport's `request` and
+    `download` methods, subclasses implement both.
+    """
+
+    @abstractmethod
+    def request(self, method, url, **kwargs):
+        """Sends a request and returns a `requests.Response`."""
+
+    @abstractmethod
+    def download(self, url, f):
+        """Streams the body at `url` into the open binary file `f`."""
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+
+class RequestsTransport(Transport):
+    """Default transport sending requests with a `requests.Session`.
+
+    Parameters
+    ----------
+    session : requests.Session
+        Session shared by every call.  By default each thread gets its own
+        session, as sessions are not documented to be thread safe.
+    """
+
+    def __init__(self, session=None):
+        self._session = session
+        self._local = threading.local()
+
+    @property
+    def session(self):
+        if self._session is not None:
+            return self._session
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def request(self, method, url, **kwargs):
+        return self.session.request(method, url, **kwargs)
+
+    def download(self, url, f):
+        # ref: https://stackoverflow.com/a/39217788/4296857
+        with self.session.get(url, stream=True) as r:
+            r.raise_for_status()
+            for block in r.iter_content(chunk_size=DOWNLOAD_BLOCK_BYTES):
+                f.write(block)
+
+
+def _paths_(directory, kind, method, url, kwargs):
+    "Metadata and body paths of a recorded `request` or `download` call"
+    payload = [
+        kind,
+        method.upper(),
+        url,
+        kwargs.get("params"),
+        kwargs.get("json"),
+        kwargs.get("data"),
+    ]
+    text = json.dumps(payload, sort_keys=True, default=str)
+    path = os.path.join(directory, hashlib.sha1(text.encode("utf-8")).hexdigest())
+    return path + ".json", path + ".body"
+
+
+class RecordingTransport(Transport):
+    """Transport saving every request/response pair to `directory`.
+
+    Each exchange is written as `<key>.json` metadata and a `<key>.body`
+    file holding the raw response bytes, bulk download zips included.
+    The recording can be served back with `ReplayTransport`.
+
+    Parameters
+    ----------
+    directory : str
+        Recording location, created if missing.
+    transport : Transport
+        Transport actually sending the requests, a `RequestsTransport` by
+        default.
+
+    Examples
+    --------
+
+    ```python
+    >>> from usaspending_client import USASpending, RecordingTransport, ReplayTransport
+    >>> usa = USASpending(transport=RecordingTransport("recording"))
+    >>> df = usa.bulk_awards(filters=filters)
+    >>> usa = USASpending(transport=ReplayTransport("recording"))
+    >>> df = usa.bulk_awards(filters=filters)
+    ```
+    """
+
+    def __init__(self, directory, transport=None):
+        super().__init__()
+        self.directory = directory
+        self.transport = transport or RequestsTransport()
+        os.makedirs(directory, exist_ok=True)
+
+    def _write_meta_(self, meta_path, method, url, response=None):
+        meta = {"method": method.upper(), "url": url, "status_code": 200}
+        if response is not None:
+            meta.update(
+                status_code=response.status_code,
+                headers=dict(response.headers),
+                encoding=response.encoding,
+            )
+        with open(meta_path, "w") as f:
+            json.dump(meta, f)
+
+    def request(self, method, url, **kwargs):
+        response = self.transport.request(method, url, **kwargs)
+        meta_path, body_path = _paths_(self.directory, "request", method, url, kwargs)
+        with open(body_path, "wb") as f:
+            f.write(response.content)
+        self._write_meta_(meta_path, method, url, response)
+        LOGGER.debug(f"Recorded {method} {url}")
+        return response
+
+    def download(self, url, f):
+        meta_path, body_path = _paths_(self.directory, "download", "GET", url, {})
+        with open(body_path, "wb") as body:
+            self.transport.download(url, body)
+        self._write_meta_(meta_path, "GET", url)
+        with open(body_path, "rb") as body:
+            shutil.copyfileobj(body, f, DOWNLOAD_BLOCK_BYTES)
+        LOGGER.debug(f"Recorded download {url}")
+
+
+class ReplayTransport(Transport):
+    """Transport serving responses saved by `RecordingTransport`.
+
+    Parameters
+    ----------
+    directory : str
+        Recording location.
+    """
+
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = directory
+
+    def _open_(self, kind, method, url, kwargs):
+        meta_path, body_path = _paths_(self.directory, kind, method, url, kwargs)
+        if not os.path.exists(meta_path):
+            raise KeyError(f"No recorded response for {method.upper()} {url}")
+        with open(meta_path) as f:
+            meta = json.load(f)
+        return meta, body_path
+
+    def request(self, method, url, **kwargs):
+        meta, body_path = self._open_("request", method, url, kwargs)
+        response = requests.Response()
+        response.status_code = meta["status_code"]
+        response.headers = CaseInsensitiveDict(meta.get("headers", {}))
+        response.encoding = meta.get("encoding")
+        response.url = url
+        with open(body_path, "rb") as f:
+            response._content = f.read()
+        response._content_consumed = True
+        return response
+
+    def download(self, url, f):
+        meta, body_path = self._open_("download", "GET", url, {})
+        with open(body_path, "rb") as body:
+            shutil.copyfileobj(body, f, DOWNLOAD_BLOCK_BYTES)
@@ -1,5 +1,9 @@
+import re
+
 from functools import wraps
 
+import pandas as pd
+
 
 def log_decorator(logger, level=10):
     def real_decorator(function):
@@ -36,3 +40,77 @@ def flatten_dict(nested_dictionary, delimiter=":"):
 
     get_all_values(nested_dictionary=nested_dictionary, parent_key="")
     return res
+
+
+def filter_chunk(chunk, predicate=None):
+    "Applies a row predicate to a dataframe chunk"
+    if predicate is None:
+        return chunk
+    if isinstance(predicate, str):
+        return chunk.query(predicate)
+    try:
+        mask = predicate(chunk)
+    except (KeyError, AttributeError) as e:
+        msg = (
+            f"Predicate failed on the parsed columns ({e}).  Callable predicates "
+            "only see `columns`, add it there or use a query string predicate."
+        )
+        raise ValueError(msg) from e
+    return chunk[mask]
+
+
+def _references_(column, expression):
+    "Whether a `pd.DataFrame.query` expression may use `column`"
+    if f"`{column}`" in expression:
+        return True
+    pattern = rf"(?<![\w`]){re.escape(column)}(?![\w`])"
+    return re.search(pattern, expression) is not None
+
+
+def iter_csv_chunks(
+    fileobj, columns=None, predicate=None, chunksize=100000, dtype=None
+):
+    """Yields filtered dataframe chunks from a csv file object.
+
+    Only the requested `columns`, plus any column a query string `predicate`
+    uses, are parsed.  Rows failing `predicate` are dropped chunk by chunk
+    before projecting to `columns`, so memory scales with the data that is kept.
+
+    Parameters
+    ----------
+    fileobj : file-like
+        Open csv file, e.g. a zip archive member.
+    columns : list[str]
+        Columns to parse, all columns if None.
+    predicate : str or callable
+        A `pd.DataFrame.query` expression or a callable returning a boolean
+        mask for a chunk.  Callables only see `columns`.
+    chunksize : int
+        Number of rows parsed per chunk.
+    dtype : type or dict
+        Passed to `pd.read_csv`.  Column types are inferred per chunk, so a
+        code column mixing digits and letters, e.g. `'7030'` and `'R425'`, comes
+        back as ints in some chunks and strings in others unless given here,
+        e.g. `{"product_or_service_code": str}`.
+    """
+    usecols = columns
+    if columns is not None and isinstance(predicate, str):
+        keep = set(columns)
+
+        def keep_column(column):
+            return column in keep or _references_(column, predicate)
+
+        usecols = keep_column
+
+    reader = pd.read_csv(
+        fileobj,
+        usecols=usecols,
+        dtype=dtype,
+        chunksize=chunksize,
+        low_memory=False,
+    )
+    for chunk in reader:
+        chunk = filter_chunk(chunk, predicate)
+        if columns is not None:
+            chunk = chunk[list(columns)]
+        yield chunk